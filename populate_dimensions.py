@@ -22,25 +22,33 @@ How It Works (Pipeline):
     2. Iterate Assets
        - Loop through each block in blockList
        - Construct file path to the PNG image
+       - Hand the file reads to a pool of worker threads
        
     3. Read Images
-       - Use PIL (Python Imaging Library) to open PNG
-       - Extract width/height without loading entire image into memory
+       - Reuse cached dimensions for files unchanged since the last run
+       - Read the 24-byte PNG header and unpack width/height from IHDR
+       - Fall back to PIL (Python Imaging Library) for non-PNG files
+       - Never decodes pixel data
        
     4. Update JSON
        - Add "width" and "height" properties to block
-       - Overwrite existing values if present
+       - Blocks that already have both are left alone (use --force to
+         re-read and overwrite them)
        
     5. Save Results
-       - Write updated JSON back to disk
-       - Pretty-print formatting for readability
+       - Skip the write entirely if no dimension changed
+       - Otherwise patch only the changed blocks into the original text,
+         falling back to re-serializing the whole document
+       - Write updated JSON back to disk (temp file + atomic rename)
+       - Pretty-print formatting for readability (or --compact for a
+         smaller, faster-to-write file)
        - Report statistics (updated, skipped, errors)
     
 Key Programming Concepts Demonstrated:
     
     1. File I/O
-       - Reading: open(), json.load(), Path operations
-       - Writing: json.dump() with formatting
+       - Reading: open() in binary mode, json/orjson loads, os.scandir listings
+       - Writing: pretty-printed UTF-8 bytes
        - Error handling: try/except for file operations
        - Encoding: UTF-8 for international character support
        
@@ -50,13 +58,15 @@ Key Programming Concepts Demonstrated:
        - Nested access: block.get('putUnder', '') with defaults
        
     3. Image Processing
-       - PIL/Pillow library: Industry-standard image library
-       - Lazy loading: Reading dimensions without loading pixel data
+       - Binary file formats: PNG signature + IHDR chunk at a fixed offset
+       - struct.unpack: Decoding big-endian integers from raw bytes
+       - PIL/Pillow library: Fallback for anything that is not a PNG
        - Path resolution: Multiple naming conventions handled
        
     4. Path Manipulation
-       - pathlib.Path: Modern Python path handling (cross-platform)
-       - String manipulation: .stem, .with_suffix() for filename operations
+       - Plain f-string paths ("folder/name.png"): the hot loop builds one
+         string per block instead of several pathlib objects
+       - String manipulation: .split('__') for filename conventions
        
     5. Error Handling Strategy
        - Graceful degradation: Skip problematic files
@@ -65,7 +75,7 @@ Key Programming Concepts Demonstrated:
        
     6. Defensive Programming
        - Default values: .get() with fallback values
-       - Existence checks: path.exists() before accessing
+       - Existence checks: look a file up in its folder listing before opening
        - Type validation: Check for valid src before processing
        
     7. Script Entry Point
@@ -73,6 +83,8 @@ Key Programming Concepts Demonstrated:
        - Sys exit codes: Proper exit status reporting
        
 Additional Learning Resources:
+    - PNG file structure: https://www.w3.org/TR/png/#5Chunk-layout
+    - struct module: https://docs.python.org/3/library/struct.html
     - PIL/Pillow docs: https://python-pillow.org/
     - pathlib module: https://docs.python.org/3/library/pathlib.html
     - JSON in Python: https://docs.python.org/3/library/json.html
@@ -82,47 +94,485 @@ Additional Learning Resources:
 Usage Examples:
     python populate_dimensions.py
     python populate_dimensions.py --json /path/to/assets.json
+    python populate_dimensions.py --force    # Re-read blocks that already have dimensions
+    python populate_dimensions.py --compact  # Write minified JSON (no indentation)
     
 Exit Codes:
     0 = Success
     1 = File not found
     2 = Invalid JSON format
-    3 = PIL not installed
 
 Dependencies:
     - Python 3.6+
-    - Pillow (PIL): pip install Pillow
+    - orjson, optional: pip install orjson
+      Faster JSON load/save; the standard library json module is used otherwise.
+    - Pillow (PIL), optional: pip install Pillow
+      Only needed if an asset is not a PNG; PNG headers are parsed directly.
+      Pillow-SIMD is a drop-in replacement and works unchanged:
+          pip uninstall pillow && pip install pillow-simd
+      It only pays off for pixel decoding, though; the fallback just opens
+      the file and reads .size from the header, so stock Pillow is fine.
 """
 
+import argparse
 import json
 import os
-from pathlib import Path  # Modern path handling (better than os.path)
-from PIL import Image    # Pillow library: pip install Pillow
+import re                  # Locate blocks in the raw JSON text
+import struct              # Unpack binary header fields
+import sys
+from collections import Counter  # Tally per-block outcomes
+from concurrent.futures import ThreadPoolExecutor  # Overlap file reads
+
+# JSON backend: orjson (C-accelerated, works on UTF-8 bytes) when installed,
+# otherwise the standard library. Both produce identical 2-space output.
+try:
+    import orjson
+    
+    def _loads(raw):
+        return orjson.loads(raw)
+    
+    def _dumps(data, compact=False):
+        return orjson.dumps(data, option=None if compact else orjson.OPT_INDENT_2)
+except ImportError:
+    orjson = None
+    
+    def _loads(raw):
+        return json.loads(raw)
+    
+    def _dumps(data, compact=False):
+        if compact:
+            return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+# Image file extensions the folder index will match a block's src against.
+# Listed in order of preference when two files share the same stem.
+IMAGE_SUFFIXES = ('.png',)
+
+# Every PNG file starts with this fixed 8-byte signature
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+# Sidecar file (next to assets.json) caching dimensions by file mtime/size
+DIM_CACHE_NAME = 'dim_cache.json'
+
+# Number of threads reading image headers at once. Header reads are tiny and
+# mostly wait on the disk, so more threads than CPU cores is fine.
+PROBE_THREADS = 32
+
+# PIL.Image module, imported on first use by _get_pil()
+_Image = None
+
+# ============================================================================
+# HELPER: Read image dimensions from the file header
+# ============================================================================
+
+def _get_pil():
+    """
+    Return the PIL.Image module, importing it on the first call.
+    
+    Why lazy?
+        PIL costs ~80ms to import and the PNG fast path in _png_size
+        almost never needs it. Importing this script (e.g. from a test or
+        build tool) therefore loads nothing beyond the standard library
+        and orjson.
+    
+    Raises:
+        ValueError: Pillow is not installed
+    """
+    global _Image
+    if _Image is None:
+        try:
+            from PIL import Image  # Pillow library: pip install Pillow
+        except ImportError:
+            raise ValueError("not a PNG file and Pillow is not installed") from None
+        _Image = Image
+    return _Image
+
+
+def _png_size(path):
+    """
+    Return (width, height) of an image by reading only its header.
+    
+    PNG Layout (first 24 bytes):
+        bytes 0-7    signature  \x89 P N G \r \n \x1a \n
+        bytes 8-11   IHDR chunk length
+        bytes 12-15  chunk type "IHDR"
+        bytes 16-19  width  (big-endian unsigned int)
+        bytes 20-23  height (big-endian unsigned int)
+    
+    The PNG spec requires IHDR to be the first chunk, so the dimensions are
+    always at the same offset. Reading 24 bytes is far cheaper than asking
+    PIL to open the file, which imports codec plugins and builds a decoder.
+    
+    Files that are not PNGs fall back to PIL (if installed).
+    
+    Raises:
+        ValueError: Not a PNG and PIL is unavailable, or the header is truncated
+    """
+    with open(path, 'rb') as f:
+        header = f.read(24)
+    
+    if header[:8] == PNG_SIGNATURE and len(header) == 24:
+        return struct.unpack('>II', header[16:24])
+    
+    # Not a PNG (or truncated): let PIL figure out the format
+    with _get_pil().open(path) as img:
+        return img.size
+
+# ============================================================================
+# HELPER: Dimension cache (dim_cache.json)
+# ============================================================================
+
+def _load_dim_cache(path):
+    """
+    Load the dimension cache written by a previous run.
+    
+    Format:
+        { "blocks/VPs/VPs__0.png": [mtime_ns, size_bytes, width, height], ... }
+    
+    A missing or unreadable cache is not an error - it just means every
+    image gets probed this time.
+    """
+    try:
+        with open(path, 'rb') as f:
+            cache = _loads(f.read())
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+# ============================================================================
+# HELPER: Crash-safe file write
+# ============================================================================
+
+def _write_atomic(path, payload):
+    """
+    Replace the file at `path` with `payload` (bytes) in one step.
+    
+    Write-Then-Rename Pattern:
+        1. Write everything to a temporary file next to the target
+        2. os.replace() swaps it into place (atomic on POSIX and Windows)
+    
+    If the script is interrupted mid-write, only the .tmp file is damaged;
+    the original assets.json is untouched. A large buffer lets a typical
+    assets.json go out in a single write() call.
+    """
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, 'wb', buffering=1 << 20) as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+    except BaseException:
+        # Don't leave a stray temp file behind on failure
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+# ============================================================================
+# HELPER: Patch width/height into the existing JSON text
+# ============================================================================
+
+# "src": "<value>" as it appears in the file (value still JSON-escaped)
+_SRC_RE = re.compile(r'"src"(\s*:\s*)"((?:[^"\\]|\\.)*)"')
+
+# A JSON string or a bare double quote, used to check a span's quote balance
+_QUOTE_RE = re.compile(r'\\.|"')
+
+
+def _balanced(text):
+    """True if `text` holds an even number of unescaped double quotes."""
+    return sum(1 for tok in _QUOTE_RE.findall(text) if tok == '"') % 2 == 0
+
+
+def _patch_dimensions(raw, patches):
+    """
+    Write new width/height values straight into the original JSON text.
+    
+    Parameters:
+        raw (bytes): assets.json as read from disk
+        patches (list): (src, width, height) for every block whose
+            dimensions changed
+    
+    Returns:
+        bytes: The patched document, or None if any block could not be
+               patched safely (the caller then re-serializes everything)
+    
+    Why patch instead of re-serialize?
+        A run usually changes a handful of integers in a large file.
+        Patching touches only those blocks: everything else, including
+        hand formatting, key order and number spelling, stays byte-for-byte
+        as it was.
+    
+    Safety Rules (any failure returns None):
+        - The block's "src" value must appear exactly once in the file
+        - The block span is the nearest { before and } after that "src";
+          both braces must be outside strings (checked by quote balance),
+          which holds because blocks are flat objects
+        - width/height keys must appear at most once in the span
+    """
+    text = raw.decode('utf-8')
+    
+    # One pass over the file finds every "src" (O(file), not O(file*edits))
+    src_matches = {}
+    for m in _SRC_RE.finditer(text):
+        src_matches.setdefault(m.group(2), []).append(m)
+    
+    edits = []  # (start, end, replacement) for each block span
+    for src, width, height in patches:
+        matches = src_matches.get(json.dumps(src, ensure_ascii=False)[1:-1], [])
+        if len(matches) != 1:
+            return None
+        m = matches[0]
+        start = text.rfind('{', 0, m.start())
+        end = text.find('}', m.end())
+        if start < 0 or end < 0:
+            return None
+        if not _balanced(text[start:m.start()]) or not _balanced(text[m.end():end]):
+            return None
+        
+        span = text[start:end]
+        colon = m.group(1)  # Reuse the file's own ": " spacing
+        for key, value in (('width', width), ('height', height)):
+            key_re = re.compile(rf'("{key}"\s*:\s*)-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?')
+            found = key_re.findall(span)
+            if len(found) > 1:
+                return None
+            if found:
+                span = key_re.sub(lambda km: f"{km.group(1)}{value}", span)
+                continue
+            # Key is new: append it after the block's last member,
+            # indented like the "src" line
+            line_start = text.rfind('\n', 0, m.start()) + 1
+            indent = text[line_start:m.start()]
+            body = span.rstrip()
+            if indent.strip() == '' and line_start > start:
+                sep = f",\n{indent}"  # One member per line
+            else:
+                sep = ", " if colon.strip() != colon else ","  # Single-line block
+            span = f'{body}{sep}"{key}"{colon}{value}{span[len(body):]}'
+        edits.append((start, end, span))
+    
+    # Splice from the end so earlier offsets stay valid
+    pieces = []
+    pos = len(text)
+    for start, end, span in sorted(edits, reverse=True):
+        if end > pos:
+            return None  # Overlapping spans: duplicate block, give up
+        pieces.append(text[end:pos])
+        pieces.append(span)
+        pos = start
+    pieces.append(text[:pos])
+    return ''.join(reversed(pieces)).encode('utf-8')
+
+# ============================================================================
+# HELPERS: Resolve a block's image file, then measure it
+# ============================================================================
+
+def _index_folders(block_list):
+    """
+    List every putUnder folder once and remember the image files in it.
+    
+    Returns:
+        dict: {folder: {stem: os.DirEntry}}, keyed by file name without
+              its extension. Only regular files with a suffix from
+              IMAGE_SUFFIXES are kept. Missing folders map to an empty
+              dict, so every lookup simply reports "not found".
+    
+    Why not just call Path.exists()?
+        Each .exists() is a separate stat() syscall. With two candidate
+        names per block that is ~2 syscalls per block, while the blocks
+        only live in a handful of folders. One os.scandir() per folder
+        answers every existence question with an in-memory dict lookup.
+        The DirEntry is kept so the dim cache can ask it for mtime/size
+        later (entry.stat() is cached on the entry after the first call).
+    """
+    dir_index = {}
+    for block in block_list:
+        folder = block.get('putUnder', '')
+        if folder in dir_index:
+            continue
+        stems = {}
+        try:
+            with os.scandir(folder or '.') as entries:
+                for entry in entries:
+                    stem, dot, suffix = entry.name.rpartition('.')
+                    if not dot or f".{suffix.lower()}" not in IMAGE_SUFFIXES:
+                        continue
+                    if not entry.is_file():
+                        continue
+                    # Keep the preferred suffix if a stem appears twice
+                    other = stems.get(stem)
+                    if other is None or _suffix_rank(entry.name) < _suffix_rank(other.name):
+                        stems[stem] = entry
+        except OSError:
+            pass
+        dir_index[folder] = stems
+    return dir_index
+
+
+def _suffix_rank(name):
+    """Position of a file's extension in IMAGE_SUFFIXES (lower is preferred)."""
+    return IMAGE_SUFFIXES.index(f".{name.rpartition('.')[2].lower()}")
+
+
+def _resolve_image(i, block, dir_index, force_refresh=False):
+    """
+    Work out which image file a block refers to.
+    
+    This step is cheap (dict lookups against the folder listings from
+    _index_folders), so it runs serially in the main thread. Only the file
+    reads are handed to threads.
+    
+    Parameters:
+        i (int): Position of the block in blockList (for log messages)
+        block (dict): The block definition
+        dir_index (dict): Folder listings from _index_folders()
+        force_refresh (bool): Re-read blocks that already have width/height
+    
+    Returns:
+        tuple: (status, image_path, entry, text, messages)
+            - status is 'found', 'skipped' or 'error'
+            - image_path and entry (its os.DirEntry) are None unless
+              status is 'found'
+            - text is the block's display name
+            - messages is a list of log lines (empty when 'found')
+    
+    Data Structure Pattern:
+        Each block is a dictionary like:
+        {
+          "putUnder": "blocks/templates",
+          "src": "templates__green_normal",
+          "text": "Green Card Template",
+          "width": 826,          # We're adding this
+          "height": 1126         # We're adding this
+        }
+    """
+    # Get key properties from block definition
+    put_under = block.get('putUnder', '')  # Folder/category name
+    src = block.get('src', '')              # Base filename (no extension)
+    text = block.get('text', src)           # Display name (fallback to src)
+    
+    # Skip blocks with no source identifier
+    # This prevents attempting to find images for placeholder entries
+    if not src:
+        return 'skipped', None, None, text, [f"  [{i+1}] Skipping '{text}': no src field"]
+    
+    # Skip the debug_sprite_sheet (it's not a real PNG file, it's generated)
+    # debug_sprite_sheet is a special entry used to reference dynamically
+    # generated sprite sheets, not a real image file
+    if src == 'debug_sprite_sheet':
+        return 'skipped', None, None, text, [f"  [{i+1}] Skipping '{text}': virtual template"]
+    
+    # Fast path: dimensions are already populated, nothing to look up
+    # (unless the caller asked to refresh everything)
+    if not force_refresh and 'width' in block and 'height' in block:
+        return 'skipped', None, None, text, [
+            f"  [{i+1}] Skipping '{text}': already {block['width']}x{block['height']}"
+        ]
+    
+    # ========================================================================
+    # PATH RESOLUTION: Handle multiple naming conventions
+    # ========================================================================
+    
+    """
+    Challenge: PNG files use two different naming conventions:
+    
+    Convention 1: Prefixed
+        - PNG filename: "category__filename.png"
+        - Location: blocks/category/ folder
+        - Example: "resources__titanium.png" in blocks/resources/
+        
+    Convention 2: Unprefixed
+        - PNG filename: "filename.png"
+        - Location: blocks/category/ folder
+        - Example: "titanium.png" in blocks/resources/
+    
+    Resolution Strategy:
+        - Build the candidate stems in order: prefixed, src as written,
+          unprefixed
+        - Look each one up in the folder's {stem: entry} index
+        - First hit wins; a new convention is just one more candidate
+    
+    Why two conventions?
+        - Legacy code used prefixed names
+        - Newer code prefers unprefixed (cleaner organization)
+        - This flexibility maintains compatibility with both
+        
+    Lesson: Defensive programming - don't assume file naming is consistent
+    """
+    # Candidate stems, most specific first (prefixed putUnder__src.png)
+    if '__' not in src:
+        prefixed_stem = f"{put_under}__{src}"
+    else:
+        prefixed_stem = src
+    candidates = list(dict.fromkeys((prefixed_stem, src, src.split('__')[-1])))
+    
+    # Check which file actually exists (in-memory lookup, no syscall)
+    # Paths are plain relative strings: putUnder is always a POSIX-style
+    # folder inside the repo, so no pathlib objects are needed here.
+    folder = f"{put_under}/" if put_under else ''
+    folder_stems = dir_index.get(put_under, {})
+    for stem in candidates:
+        entry = folder_stems.get(stem)
+        if entry is not None:
+            return 'found', f"{folder}{entry.name}", entry, text, []
+    
+    # If no candidate exists, report an error
+    return 'error', None, None, text, [
+        f"  [{i+1}] ERROR: '{text}' - Image not found:",
+        *(f"         Tried: {folder}{stem}{IMAGE_SUFFIXES[0]}" for stem in candidates),
+    ]
+
+
+def _probe(image_path):
+    """
+    Read one image's dimensions; runs on a worker thread.
+    
+    Returns:
+        tuple: (width, height, error) - error is None on success, otherwise
+               the exception raised while reading (width/height are None)
+    
+    Why threads (not processes)?
+        The work is a tiny file read. Threads release the GIL while
+        blocked in open()/read(), so many reads overlap on the disk, and
+        there is no process start-up or pickling cost.
+    """
+    try:
+        width, height = _png_size(image_path)  # (width_px, height_px)
+    except Exception as e:
+        # Catch any errors during image reading (corrupt file, wrong format, etc.)
+        return None, None, e
+    return width, height, None
 
 # ============================================================================
 # MAIN FUNCTION: Orchestrates the dimension population process
 # ============================================================================
 
-def populate_dimensions(json_path='assets.json'):
+def populate_dimensions(json_path='assets.json', force_refresh=False, compact=False):
     """
     Read assets.json, scan PNG files to get dimensions, and update each block.
     
     Function Signature:
-        populate_dimensions(json_path='assets.json') -> dict
+        populate_dimensions(json_path='assets.json', force_refresh=False, compact=False) -> dict
     
     Parameters:
         json_path (str): Path to the assets.json file (default: 'assets.json')
+        force_refresh (bool): Re-read images for blocks that already have
+            width/height (default: False, those blocks are skipped)
+        compact (bool): Write minified JSON instead of 2-space indented
+            (default: False, keeps the file readable for hand edits)
     
     Returns:
         dict: Statistics dictionary with keys:
             - 'updated': Number of blocks with dimensions added/updated
-            - 'skipped': Number of blocks skipped (missing src, virtual, etc.)
+            - 'skipped': Number of blocks skipped (missing src, virtual,
+                         already populated, etc.)
             - 'errors': Number of blocks that failed to process
             - 'total': Total blocks processed
     
     Raises:
         FileNotFoundError: If assets.json doesn't exist
-        json.JSONDecodeError: If assets.json is invalid JSON
+        ValueError: If assets.json is invalid JSON (json/orjson JSONDecodeError)
         
     Example:
         stats = populate_dimensions('assets.json')
@@ -135,7 +585,7 @@ def populate_dimensions(json_path='assets.json'):
            ↓
         Construct Path
            ↓
-        Read Image
+        Read Image (in parallel worker threads)
            ↓
         Update JSON
            ↓
@@ -152,175 +602,176 @@ def populate_dimensions(json_path='assets.json'):
     """
     # Read the JSON file containing all asset definitions
     print(f"Reading {json_path}...")
-    with open(json_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)  # Parse JSON into Python dictionary
+    with open(json_path, 'rb') as f:
+        raw = f.read()
+    data = _loads(raw)  # Parse JSON (UTF-8 bytes) into Python dictionary
     
     # Extract the blockList array (main list of image assets)
     # Using .get() with default empty list prevents KeyError if key missing
     block_list = data.get('blockList', [])
     print(f"Found {len(block_list)} blocks to process")
     
-    # Track statistics for final report
-    # These counters help verify the script worked as expected
-    updated_count = 0
-    skipped_count = 0
-    error_count = 0
+    # Statistics for the final report: each block gets one outcome
+    # ('updated', 'skipped' or 'error'), tallied with a Counter after the
+    # merge instead of bumping shared counters inside the loop
+    cached_count = 0   # Updated from dim_cache.json without opening the file
     
     # ========================================================================
-    # MAIN PROCESSING LOOP
+    # MAIN PROCESSING: Resolve paths, then read headers in parallel
     # ========================================================================
     
-    # Process each block entry
-    for i, block in enumerate(block_list):
-        """
-        Inner Loop: Process single block
-        
-        Data Structure Pattern:
-            Each block is a dictionary like:
-            {
-              "putUnder": "blocks/templates",
-              "src": "templates__green_normal",
-              "text": "Green Card Template",
-              "width": 826,          # We're adding this
-              "height": 1126         # We're adding this
-            }
-        """
-        # Get key properties from block definition
-        put_under = block.get('putUnder', '')  # Folder/category name
-        src = block.get('src', '')              # Base filename (no extension)
-        text = block.get('text', src)           # Display name (fallback to src)
-        
-        # Skip blocks with no source identifier
-        # This prevents attempting to find images for placeholder entries
-        if not src:
-            print(f"  [{i+1}] Skipping '{text}': no src field")
-            skipped_count += 1
+    """
+    Two-Phase Pattern:
+        Phase 1: List each folder once, then resolve every block's image
+                 path serially against those listings (cheap set lookups)
+        Phase 2: Fan the header reads out to a thread pool (disk I/O),
+                 skipping files whose dimensions are already cached
+        Merge:   Walk the blocks in their original order, write dimensions
+                 back into block_list, collect log lines, record outcomes
+    
+    Executor.map() returns results in input order, so the merge (and the
+    log output) is deterministic no matter which thread finishes first.
+    The per-block log lines are collected in a list and written to stdout
+    in one call, instead of one print() (and, when piped, one write
+    syscall) per block.
+    """
+    dir_index = _index_folders(block_list)
+    resolved = [
+        _resolve_image(i, block, dir_index, force_refresh)
+        for i, block in enumerate(block_list)
+    ]
+    
+    """
+    Incremental Build Pattern (dimension cache):
+        dim_cache.json (next to assets.json) remembers, for every image
+        path, the file's mtime/size and the dimensions read last time.
+        If a file's stat() still matches, its cached dimensions are reused
+        and the file is never opened. Re-running on unchanged assets costs
+        one DirEntry.stat() per block instead of one open()+read().
+    """
+    dim_cache_path = os.path.join(os.path.dirname(os.path.abspath(json_path)), DIM_CACHE_NAME)
+    # Entries for blocks skipped this run (already populated) are kept as-is
+    dim_cache = _load_dim_cache(dim_cache_path)
+    
+    dims = {}       # block index -> (width, height, error)
+    stamps = {}     # block index -> (cache key, mtime_ns, size)
+    to_probe = []   # block indices whose headers must actually be read
+    for i, (status, image_path, entry, _, _) in enumerate(resolved):
+        if status != 'found':
             continue
-        
-        # Skip the debug_sprite_sheet (it's not a real PNG file, it's generated)
-        # debug_sprite_sheet is a special entry used to reference dynamically
-        # generated sprite sheets, not a real image file
-        if src == 'debug_sprite_sheet':
-            print(f"  [{i+1}] Skipping '{text}': virtual template")
-            skipped_count += 1
+        try:
+            st = entry.stat()  # Reuses the scandir entry; no path lookup
+        except OSError as e:
+            dims[i] = (None, None, e)
             continue
-        
-        # ====================================================================
-        # PATH RESOLUTION: Handle multiple naming conventions
-        # ====================================================================
-        
-        """
-        Challenge: PNG files use two different naming conventions:
-        
-        Convention 1: Prefixed
-            - PNG filename: "category__filename.png"
-            - Location: blocks/category/ folder
-            - Example: "resources__titanium.png" in blocks/resources/
-            
-        Convention 2: Unprefixed
-            - PNG filename: "filename.png"
-            - Location: blocks/category/ folder
-            - Example: "titanium.png" in blocks/resources/
-        
-        Resolution Strategy:
-            - Try Convention 1 first (prefixed)
-            - If not found, try Convention 2 (unprefixed)
-            - If still not found, try other combinations
-            - Use whichever file actually exists
-        
-        Why two conventions?
-            - Legacy code used prefixed names
-            - Newer code prefers unprefixed (cleaner organization)
-            - This flexibility maintains compatibility with both
-            
-        Lesson: Defensive programming - don't assume file naming is consistent
-        """
-        image_path = None
-        
-        # Try prefixed format first (putUnder__src.png)
-        if '__' not in src:
-            prefixed_name = f"{put_under}__{src}.png"
+        key = image_path
+        stamps[i] = (key, st.st_mtime_ns, st.st_size)
+        cached = dim_cache.get(key)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            dims[i] = (cached[2], cached[3], None)
+            cached_count += 1
         else:
-            prefixed_name = f"{src}.png"
-        
-        # Construct full paths using pathlib (cross-platform path handling)
-        prefixed_path = Path(put_under) / prefixed_name
-        unprefixed_path = Path(put_under) / f"{src.split('__')[-1]}.png"
-        
-        # Check which file actually exists on disk
-        if prefixed_path.exists():
-            image_path = prefixed_path
-        elif unprefixed_path.exists():
-            image_path = unprefixed_path
+            to_probe.append(i)
+    
+    with ThreadPoolExecutor(max_workers=PROBE_THREADS) as executor:
+        probe_paths = [resolved[i][1] for i in to_probe]
+        for i, result in zip(to_probe, executor.map(_probe, probe_paths)):
+            dims[i] = result
+    
+    log = []
+    patches = []   # (src, width, height) for blocks whose dimensions changed
+    outcomes = []  # One of 'updated' / 'skipped' / 'error' per block
+    for i, (status, image_path, _, text, messages) in enumerate(resolved):
+        if status != 'found':  # 'skipped' or 'error' from _resolve_image
+            log.extend(messages)
+            outcomes.append(status)
+            continue
         
-        # If neither path exists, log error and continue
-        if not image_path:
-            print(f"  [{i+1}] ERROR: '{text}' - Image not found:")
-            print(f"         Tried: {prefixed_path}")
-            print(f"         Tried: {unprefixed_path}")
-            error_count += 1
+        width, height, error = dims[i]
+        if error is not None:
+            log.append(f"  [{i+1}] ERROR: '{text}' - Failed to read image: {error}")
+            outcomes.append('error')
             continue
         
-        """
-        Read image dimensions using PIL (Python Imaging Library / Pillow)
+        key, mtime_ns, size = stamps[i]
+        dim_cache[key] = [mtime_ns, size, width, height]
         
-        PIL can open many image formats and provides a .size property
-        that returns (width, height) as a tuple.
+        # Remember real changes so the file can be patched (or left alone)
+        block = block_list[i]
+        if block.get('width') != width or block.get('height') != height:
+            patches.append((block.get('src', ''), width, height))
         
-        Why use 'with' statement?
-        - Ensures the image file is properly closed after reading
-        - Prevents resource leaks (important when processing many files)
-        - Automatically handles cleanup even if an error occurs
-        """
-        try:
-            with Image.open(image_path) as img:
-                width, height = img.size  # Returns tuple: (width_px, height_px)
-                
-            # Update the block dictionary with dimension properties
-            block['width'] = width
-            block['height'] = height
-            
-            # Log success with human-readable output
-            print(f"  [{i+1}] '{text}': {width}x{height} ({image_path})")
-            updated_count += 1
-            
-        except Exception as e:
-            # Catch any errors during image reading (corrupt file, wrong format, etc.)
-            print(f"  [{i+1}] ERROR: '{text}' - Failed to read image: {e}")
-            error_count += 1
+        # Update the block dictionary with dimension properties
+        block_list[i]['width'] = width
+        block_list[i]['height'] = height
+        
+        # Log success with human-readable output
+        log.append(f"  [{i+1}] '{text}': {width}x{height} ({image_path})")
+        outcomes.append('updated')
+    
+    counts = Counter(outcomes)  # Missing keys count as 0
+    
+    if log:
+        sys.stdout.write('\n'.join(log) + '\n')
     
     """
     Save the updated JSON back to disk
     
-    Key parameters:
+    Key parameters (see _dumps):
     - indent=2: Pretty-print with 2-space indentation (makes it human-readable)
     - ensure_ascii=False: Allow Unicode characters (important for international text)
-    - encoding='utf-8': Use UTF-8 encoding (modern standard for text files)
+    - UTF-8 bytes: Written in binary mode, so no text-layer re-encoding
     
     Why preserve formatting?
     - Makes the JSON file easy to read and edit manually if needed
     - Git diffs will be cleaner and show what changed
     - Maintains professional code quality
+    
+    With compact=True (--compact) the indentation is dropped instead:
+    separators=(',', ':') roughly halves the file and the time spent
+    serializing it, for production copies nobody edits by hand.
+    
+    Write Strategy (cheapest first):
+    1. No dimension actually changed -> don't touch the file at all
+    2. Patch just the changed blocks into the original text
+       (see _patch_dimensions); the rest of the file is copied verbatim
+    3. Otherwise (patch refused, or --compact) re-serialize everything
+    
+    The whole document is assembled into one bytes buffer first and then
+    written atomically (see _write_atomic), so an interrupted run never
+    leaves a half-written assets.json behind.
     """
-    print(f"\nWriting updated data to {json_path}...")
-    # The entire `data` dict is written back, preserving all keys including
-    # schema v2 top-level fields (schemaVersion, sets) and per-sprite metadata
-    # (id, filename, kind, sets, usage, etc.).  Only 'width'/'height' inside
-    # blockList entries are changed by this script.
-    with open(json_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    if not patches and not compact:
+        print(f"\nNo dimensions changed; {json_path} left untouched")
+    else:
+        print(f"\nWriting updated data to {json_path}...")
+        payload = None if compact else _patch_dimensions(raw, patches)
+        if payload is None:
+            # The entire `data` dict is written back, preserving all keys including
+            # schema v2 top-level fields (schemaVersion, sets) and per-sprite metadata
+            # (id, filename, kind, sets, usage, etc.).  Only 'width'/'height' inside
+            # blockList entries are changed by this script.
+            payload = _dumps(data, compact=compact)
+        _write_atomic(json_path, payload)
+    
+    # The cache is only an optimization: failing to write it is not an error
+    try:
+        _write_atomic(dim_cache_path, json.dumps(dim_cache, separators=(',', ':')).encode('utf-8'))
+    except OSError as e:
+        print(f"Warning: could not write {dim_cache_path}: {e}")
     
     # Print summary statistics
     print("\n" + "="*60)
     print("Summary:")
     print(f"  Total blocks:   {len(block_list)}")
-    print(f"  Updated:        {updated_count}")
-    print(f"  Skipped:        {skipped_count}")
-    print(f"  Errors:         {error_count}")
+    print(f"  Updated:        {counts['updated']}")
+    print(f"  From cache:     {cached_count}")
+    print(f"  Skipped:        {counts['skipped']}")
+    print(f"  Errors:         {counts['error']}")
     print("="*60)
     
     # Return success/failure status
-    if error_count > 0:
+    if counts['error'] > 0:
         print("\n⚠️  Some images could not be processed. Check errors above.")
         return False
     else:
@@ -330,15 +781,26 @@ def populate_dimensions(json_path='assets.json'):
 # Standard Python idiom: only run main code if script is executed directly
 # (not if it's imported as a module)
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Populate width/height for every block in assets.json from its PNG file."
+    )
+    parser.add_argument('--json', default='assets.json',
+                        help="path to assets.json (default: %(default)s)")
+    parser.add_argument('--force', action='store_true',
+                        help="re-read images for blocks that already have width/height")
+    parser.add_argument('--compact', action='store_true',
+                        help="write minified JSON (about half the size) instead of indented")
+    args = parser.parse_args()
+    
     try:
-        success = populate_dimensions()
+        success = populate_dimensions(args.json, force_refresh=args.force, compact=args.compact)
         # Exit with code 0 (success) or 1 (failure) for shell script integration
         exit(0 if success else 1)
     except FileNotFoundError:
-        print("ERROR: assets.json not found in current directory")
+        print(f"ERROR: {args.json} not found")
         exit(1)
-    except json.JSONDecodeError as e:
-        print(f"ERROR: Invalid JSON in assets.json: {e}")
+    except ValueError as e:  # json.JSONDecodeError and orjson.JSONDecodeError
+        print(f"ERROR: Invalid JSON in {args.json}: {e}")
         exit(1)
     except Exception as e:
         print(f"ERROR: Unexpected error: {e}")